@@ -1,16 +1,58 @@
 """Dialogue: orchestrates NLP query normalisation + remote vector search."""
 from __future__ import annotations
 
+import asyncio
+import re
+import time
+from collections import OrderedDict
+from functools import lru_cache
 from logging import Logger
 
 from razdel import tokenize
 
 from chat.interface.chat_utils import get_normal_form
+from config.consts.searching import WARMUP_QUERY
 from config.settings import AppConfig, ClientsConfig, NLPConfig
 from databases.searcher.searcher_client import HybridHit, SearcherClient
 from databases.cashing.cashing import AnswerCash
 
 
+# Alphabetic runs of two or more letters, without razdel's per-token Python overhead.
+# Not equivalent to razdel: "Санкт-Петербург" or "COVID-19" are one razdel token that
+# fails isalpha() and is dropped, while the regex emits their alphabetic parts
+TOKEN_RE = re.compile(r"[^\W\d_]{2,}")
+
+
+@lru_cache(maxsize=4096)
+def _normalize(
+    query: str,
+    stopwords: frozenset[str],
+    use_razdel: bool = True,
+) -> str:
+    """
+    Memoized query normalisation: repeated prompts skip tokenisation and lemmatisation.
+    :param query: raw user query
+    :param stopwords: stopwords to drop before lemmatisation
+    :param use_razdel: tokenise with razdel instead of the compiled regex
+    :return: space-joined lemmas
+    """
+    get_nf = get_normal_form
+    if use_razdel:
+        lemmas = [
+            get_nf(low) for t in tokenize(query)
+            # Cheap length/alpha checks first, casefold only surviving tokens
+            if len(text := t.text) > 1
+            and text.isalpha()
+            and (low := text.casefold()) not in stopwords
+        ]
+    else:
+        lemmas = [
+            get_nf(low) for m in TOKEN_RE.finditer(query)
+            if (low := m.group().casefold()) not in stopwords
+        ]
+    return " ".join(lemmas).strip()
+
+
 class Dialogue:
     """
     Main class for user-facing search.
@@ -19,6 +61,8 @@ class Dialogue:
       1. processing_query()  — tokenise + lemmatise (local NLP, pymorphy3)
       2. get_searching_results() — POST qdrant-searcher /vector_search
       3. get_cached_answers()    — POST qdrant-searcher /vector_search on cache collection
+
+    search_all() runs steps 3 and 2 for one turn as a single awaitable.
     """
 
     def __init__(
@@ -32,32 +76,51 @@ class Dialogue:
         self.logger = logger
         # Redis client kept for AnswerCash
         self.redis = clients_config.redis_client
-        self.morph = nlp_config.morph
         self.stopwords = nlp_config.stopwords
+        self.use_razdel = nlp_config.use_razdel
         self.top_k = app_config.top_k
         self.cosine_similarity_threshold = app_config.cosine_similarity_threshold
+        # (collection, normalized query) → (monotonic expiry, hybrid hits), evicted in LRU order
+        self._search_cache: OrderedDict[tuple[str, str], tuple[float, list[HybridHit]]] = OrderedDict()
+        self._search_cache_size = app_config.search_cache_size
+        self._search_cache_ttl = app_config.search_cache_ttl
+        self._inflight: dict[tuple[str, str], asyncio.Task] = {}
+        self.speculative_search = app_config.speculative_search
 
         self._searcher = SearcherClient(
             base_url=app_config.qdrant_searcher_url,
             timeout=30.0,
         )
 
+    async def warmup(self) -> None:
+        """
+        Pay cold-start costs before the first user does: load lemmas into the
+        local caches and let qdrant-searcher initialise its embedding sessions.
+        """
+        normalized = self.processing_query(WARMUP_QUERY)
+        try:
+            await self._searcher.search(
+                text=normalized,
+                collection_name=self.app_config.rag_collection,
+                method="hybrid",
+                top_k=1,
+            )
+        except Exception as exc:
+            self.logger.warning("Searcher warm-up failed: %s", exc)
+
+    async def aclose(self) -> None:
+        """Release the pooled connections to qdrant-searcher."""
+        await self._searcher.aclose()
+
     # ------------------------------------------------------------------
     # NLP
     # ------------------------------------------------------------------
 
     def processing_query(self, query: str) -> str:
         """
-        Tokenise, remove stopwords, lemmatise — all local (pymorphy3 + razdel).
+        Tokenise, remove stopwords, lemmatise — all local (pymorphy3 + regex/razdel).
         """
-        tokens = [
-            t.text.lower() for t in tokenize(query)
-            if t.text.isalpha()
-            and t.text.lower() not in self.stopwords
-            and len(t.text) > 1
-        ]
-        lemmas = [get_normal_form(tok, self.morph) for tok in tokens]
-        normalized = " ".join(lemmas).strip()
+        normalized = _normalize(query, self.stopwords, self.use_razdel)
         self.logger.info("Query: `%s` → normalized `%s`", query, normalized)
         return normalized
 
@@ -72,13 +135,43 @@ class Dialogue:
     ) -> list[HybridHit]:
         """
         Hybrid vector search via qdrant-searcher microservice.
+        Results are kept in an LRU keyed by the normalized query for search_cache_ttl
+        seconds, so repeated questions skip the embedding + search round-trip entirely.
         """
-        return await self._searcher.search(
-            text=normalized_query,
-            collection_name=collection,
-            method="hybrid",
-            top_k=self.top_k,
-        )
+        key = (collection, normalized_query)
+        cached = self._search_cache.get(key)
+        if cached is not None:
+            expires_at, hits = cached
+            if expires_at > time.monotonic():
+                self._search_cache.move_to_end(key)
+                self.logger.debug("Search cache hit for query: %s", normalized_query)
+                return hits
+            del self._search_cache[key]
+
+        # Single-flight: concurrent identical queries share one searcher request
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(
+                self._searcher.search(
+                    text=normalized_query,
+                    collection_name=collection,
+                    method="hybrid",
+                    top_k=self.top_k,
+                )
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._on_search_done(key, t))
+        # shield: one cancelled caller must not cancel the request for the others
+        return await asyncio.shield(task)
+
+    def _on_search_done(self, key: tuple[str, str], task: asyncio.Task) -> None:
+        """Drop the in-flight entry and cache successful hits."""
+        self._inflight.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        self._search_cache[key] = (time.monotonic() + self._search_cache_ttl, task.result())
+        if len(self._search_cache) > self._search_cache_size:
+            self._search_cache.popitem(last=False)
 
     async def get_cached_answers(
         self,
@@ -102,3 +195,34 @@ class Dialogue:
         if not filtered:
             self.logger.warning("No cached answer above threshold for query: %s", normalized_query)
         return filtered
+
+    async def search_all(
+        self,
+        rag_collection: str,
+        cash_collection: str,
+        normalized_query: str,
+    ) -> tuple[list[HybridHit], list[HybridHit]]:
+        """
+        Cached-answer lookup first; the hybrid RAG search only runs on a miss.
+        With `speculative_search` the RAG search starts alongside the cache
+        lookup and is cancelled on a hit — better when the hit rate is low.
+        :return: (hybrid hits from the RAG collection, cached answers)
+        """
+        if not self.speculative_search:
+            cached = await self.get_cached_answers(cash_collection, normalized_query)
+            if cached:
+                return [], cached
+            return await self.get_searching_results(rag_collection, normalized_query), cached
+
+        search_task = asyncio.create_task(
+            self.get_searching_results(rag_collection, normalized_query)
+        )
+        try:
+            cached = await self.get_cached_answers(cash_collection, normalized_query)
+        except BaseException:
+            search_task.cancel()
+            raise
+        if cached:
+            search_task.cancel()
+            return [], cached
+        return await search_task, cached
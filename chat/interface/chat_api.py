@@ -0,0 +1,152 @@
+import asyncio
+from urllib.parse import quote
+from logging import Logger
+from typing import AsyncIterator, Callable
+
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import StreamingResponse
+
+from config.consts.tab_config import TabConfig
+from config.settings import AppConfig, ChatRequest, RAGTabConfig
+from chat.interface.chat_utils import answer_display, search_display
+from chat.backend.dialogue import Dialogue
+from llm.ollama_configs import OllamaDenseEmbedding
+from llm.semantic_cache import SemanticLLMCache
+
+STREAM_MEDIA_TYPE = "text/plain; charset=utf-8"
+# Streamed answers carry their sources percent-encoded in this header
+DISPLAY_DOCS_HEADER = "X-Display-Docs"
+
+
+async def _single_chunk(text: str) -> AsyncIterator[str]:
+    """Stream an already complete answer as one chunk"""
+    yield text
+
+
+def _stream(deltas: AsyncIterator[str], display_docs: str) -> StreamingResponse:
+    """Plain-text answer stream with the sources sent ahead in a header"""
+    return StreamingResponse(
+        deltas,
+        media_type=STREAM_MEDIA_TYPE,
+        headers={DISPLAY_DOCS_HEADER: quote(display_docs)},
+    )
+
+
+def _discard(task: asyncio.Task | None) -> None:
+    """Cancel a task whose result is not needed, retrieving any error it already raised"""
+    if task is None:
+        return
+    if not task.done():
+        task.cancel()
+    elif not task.cancelled():
+        task.exception()
+
+
+def create_chat_api(
+        tabs: list[TabConfig],
+        app: FastAPI,
+        app_config: AppConfig,
+        dialogue: Dialogue,
+        embedder: OllamaDenseEmbedding,
+        semantic_cache: SemanticLLMCache,
+        ask_llm: Callable,
+        logger: Logger
+):
+    """Setup JSON chat endpoint with a semantic answer cache in front of RAG + LLM"""
+    tabs_by_prefix = {tab.prefix: tab for tab in tabs}
+
+    @app.post("/api/chat")
+    async def chat_endpoint(req: ChatRequest):
+        """
+        Answer a question; standalone questions close to a cached one reuse its answer.
+        With stream=true the answer is sent as plain-text deltas while it is generated,
+        and display_docs arrives first, percent-encoded in the X-Display-Docs header.
+        """
+        logger.info("API request: %s", req.question)
+        tab = tabs_by_prefix.get(req.tab)
+        if tab is None:
+            raise HTTPException(status_code=404, detail=f"Unknown tab: {req.tab}")
+
+        async def retrieve() -> tuple[list, list]:
+            normalized = await asyncio.to_thread(dialogue.processing_query, req.question)
+            return await dialogue.search_all(
+                rag_collection=app_config.rag_collection,
+                cash_collection=app_config.cash_collection,
+                normalized_query=normalized,
+            )
+
+        # Only the RAG tab searches the knowledge base and the answer cache collection
+        rag = isinstance(tab, RAGTabConfig)
+        results, priority_results = [], []
+        # Follow-ups depend on the history, so only standalone questions use the cache
+        use_cache = not req.history
+        query_vector = None
+        if use_cache:
+            # Search runs while the question is embedded; dropped on a cache hit
+            search_task = asyncio.create_task(retrieve()) if rag else None
+            try:
+                try:
+                    query_vector = await asyncio.to_thread(
+                        lambda: next(iter(embedder.query_embed(req.question)))
+                    )
+                except Exception as e:
+                    # The cache is only an optimisation: answer without it
+                    logger.warning("Query embedding failed, semantic cache skipped: %s", e)
+                    use_cache = False
+                if use_cache:
+                    cached = semantic_cache.lookup(query_vector, namespace=tab.prefix)
+                    if cached is not None:
+                        logger.info("Semantic cache hit")
+                        answer, display_docs = cached
+                        if req.stream:
+                            return _stream(_single_chunk(answer), display_docs)
+                        return {"answer": answer, "display_docs": display_docs, "cached": True}
+                if search_task is not None:
+                    results, priority_results = await search_task
+            finally:
+                # Covers cache hits, lookup errors and cancellation of the handler
+                _discard(search_task)
+        elif rag:
+            results, priority_results = await retrieve()
+
+        if priority_results:
+            _, display_docs = await answer_display(priority_results)
+            deltas = _single_chunk(priority_results[0].document)
+        else:
+            docs, display_docs = [], ""
+            if rag:
+                try:
+                    docs, display_docs = await search_display(results, logger)
+                except ValueError as e:
+                    raise HTTPException(status_code=404, detail=str(e))
+            deltas = ask_llm(
+                logger=logger,
+                llm=tab.llm,
+                system_prompt=tab.system_prompt,
+                query=req.question,
+                context=docs,
+                history=req.history,
+                results=results,
+            )
+
+        async def relay() -> AsyncIterator[str]:
+            """Pass deltas through and cache the full answer once generation ends"""
+            parts = []
+            async for delta in deltas:
+                parts.append(delta)
+                yield delta
+            answer = "".join(parts)
+            if use_cache and answer:
+                semantic_cache.add(
+                    query_vector,
+                    answer,
+                    display_docs,
+                    namespace=tab.prefix,
+                    ttl=tab.cache_ttl,
+                )
+
+        if req.stream:
+            return _stream(relay(), display_docs)
+
+        answer = "".join([delta async for delta in relay()])
+        return {"answer": answer, "display_docs": display_docs, "cached": False}
@@ -1,4 +1,5 @@
 import asyncio
+from collections import deque
 from logging import Logger
 from typing import Callable
 import uuid
@@ -15,7 +16,6 @@ from config.consts.tab_config import TabConfig
 from config.settings import (
     AppConfig,
     ClientsConfig,
-    EmbeddingModelsConfig,
     RAGTabConfig,
 )
 from chat.interface.chat_utils import (
@@ -25,13 +25,37 @@ from chat.interface.chat_utils import (
 from chat.backend.dialogue import Dialogue  
 from databases.cashing.cashing import AnswerCash
 
+# Message bubble classes, shared by every render_message call
+SYSTEM_ROW_CLS = "w-full justify-center mb-2"
+SYSTEM_TEXT_CLS = "text-gray-600 text-sm italic"
+MESSAGE_ROW_CLS = "items-start gap-3 mb-4 w-full"
+AVATAR_CLS = "shrink-0"
+MESSAGE_COLUMN_CLS = "flex-1"
+USER_BUBBLE_CLS = "bg-blue-100 p-3 rounded-lg max-w-prose"
+BOT_DOCS_CLS = "bg-yellow-100 p-3 rounded-lg max-w-prose mb-2"
+BOT_ANSWER_CLS = "bg-green-100 p-3 rounded-lg max-w-prose"
+
+# Installed once per page: keeps the history pinned to the bottom on every DOM
+# update, instead of a timer + JS round-trip after each answer
+AUTOSCROLL_SCRIPT = """
+<script>
+document.addEventListener("DOMContentLoaded", () => {
+    new MutationObserver(() => {
+        const container = document.querySelector('.overflow-y-auto');
+        if (container) {
+            container.scrollTop = container.scrollHeight;
+        }
+    }).observe(document.body, {childList: true, subtree: true});
+});
+</script>
+"""
+
 
 def create_chat_page(
         tab: TabConfig,
         app: FastAPI,
         app_config: AppConfig,
         clients_config: ClientsConfig,
-        embedding_models_config: EmbeddingModelsConfig,
         dialogue: Dialogue,
         ask_llm: Callable,
         logger: Logger
@@ -40,19 +64,19 @@ def create_chat_page(
     prefix = tab.prefix
     header = tab.header
     system_prompt = tab.system_prompt
-    llm = tab.llm
 
     sessions: dict[str, AnswerCash] = {}
 
     @ui.page(f"/{prefix}")
     def chat_page() -> None:
         """Main page for chat"""
-        history: list[tuple[str, str]] = []
-        session_id = f"{prefix}_{str(uuid.uuid4())}"
+        # Bounded window keeps the prompt size flat over long conversations
+        history: deque[tuple[str, str]] = deque(maxlen=app_config.history_window)
+        session_id = f"{prefix}_{uuid.uuid4().hex}"
         answer_cash = AnswerCash(
             logger=logger,
             clients_config = clients_config,
-            embedding_model_config=embedding_models_config,
+            app_config=app_config,
             collection_name=app_config.cash_collection,
             timeout_minutes=app_config.timeout,
             session_id=session_id,
@@ -61,10 +85,11 @@ def create_chat_page(
 
         async def auto_flush():
             await asyncio.sleep(app_config.timeout * 60)
-            logger.info(f"Auto-flushing session: {session_id}")
+            logger.info("Auto-flushing session: %s", session_id)
             await answer_cash.flush()
 
         asyncio.create_task(auto_flush())
+        ui.add_head_html(AUTOSCROLL_SCRIPT)
 
         with ui.row().classes("w-[90%] h-screen"):
             with ui.column().classes("w-[15%] bg-gray-100 p-4 h-full border-r"):
@@ -82,25 +107,25 @@ def create_chat_page(
                     """Render message within explicit history_ui context"""
                     with history_ui:
                         if system:
-                            with ui.row().classes("w-full justify-center mb-2"):
-                                ui.markdown(text).classes("text-gray-600 text-sm italic")
+                            with ui.row().classes(SYSTEM_ROW_CLS):
+                                ui.markdown(text).classes(SYSTEM_TEXT_CLS)
                             return None, None
                         
                         if sender == "user":
-                            with ui.row().classes("items-start gap-3 mb-4 w-full"):
-                                ui.avatar("person", color="blue").classes("shrink-0")
-                                with ui.column().classes("flex-1"):
-                                    ui.markdown(f"**Вы:** {text}").classes("bg-blue-100 p-3 rounded-lg max-w-prose")
+                            with ui.row().classes(MESSAGE_ROW_CLS):
+                                ui.avatar("person", color="blue").classes(AVATAR_CLS)
+                                with ui.column().classes(MESSAGE_COLUMN_CLS):
+                                    ui.markdown(f"**Вы:** {text}").classes(USER_BUBBLE_CLS)
                             return None, None
                         else:
-                            with ui.row().classes("items-start gap-3 mb-4 w-full"):
-                                ui.avatar("smart_toy", color="green").classes("shrink-0")
-                                with ui.column().classes("flex-1"):
+                            with ui.row().classes(MESSAGE_ROW_CLS):
+                                ui.avatar("smart_toy", color="green").classes(AVATAR_CLS)
+                                with ui.column().classes(MESSAGE_COLUMN_CLS):
                                     if isinstance(tab, RAGTabConfig):
-                                        docs_md = ui.markdown(DOC_STANDBY).classes("bg-yellow-100 p-3 rounded-lg max-w-prose mb-2")
+                                        docs_md = ui.markdown(DOC_STANDBY).classes(BOT_DOCS_CLS)
                                     else:
                                         docs_md = ""
-                                    answer_md = ui.markdown(MODEL_STANDBY).classes("bg-green-100 p-3 rounded-lg max-w-prose")
+                                    answer_md = ui.markdown(MODEL_STANDBY).classes(BOT_ANSWER_CLS)
                             return docs_md, answer_md
 
                 async def send() -> None:
@@ -129,25 +154,22 @@ def create_chat_page(
                             priority_results=False
                             docs = list()
                             results = list()
-                            logger.info(f"Processing user message: {msg}")
+                            logger.info("Processing user message: %s", msg)
                             # Update initial placeholder messages
                             if isinstance(tab, RAGTabConfig):
                                 docs_md.content = DOC_STANDBY
                                 answer_md.content = ""
 
                                 try:
-                                    # Perform search and check cache concurrently
-                                    normalized_msg = dialogue.processing_query(msg)
-                                    search_results_task = dialogue.get_searching_results(
-                                        collection=app_config.rag_collection, 
-                                        normalized_query=normalized_msg
+                                    # Lemmatise off the event loop: cold words go through
+                                    # pymorphy3 and must not stall other clients
+                                    normalized_msg = await asyncio.to_thread(dialogue.processing_query, msg)
+                                    # Check the answer cache, fall back to RAG search on a miss
+                                    results, priority_results = await dialogue.search_all(
+                                        rag_collection=app_config.rag_collection,
+                                        cash_collection=app_config.cash_collection,
+                                        normalized_query=normalized_msg,
                                     )
-                                    best_answers_task = dialogue.get_cashed_answers(
-                                        embedding_models_config=embedding_models_config,
-                                        collection=app_config.cash_collection, 
-                                        normalized_query=normalized_msg
-                                    )
-                                    results, priority_results = await asyncio.gather(search_results_task, best_answers_task)
 
                                     if priority_results:
                                         logger.debug("Using cached answers")
@@ -164,7 +186,7 @@ def create_chat_page(
                                     docs_md.content = display_docs
 
                                 except Exception as e_search:
-                                    logger.error(f"Search error: {str(e_search)}", exc_info=True)
+                                    logger.error("Search error: %s", e_search, exc_info=True)
                                     docs_md.content = f"**Ошибка поиска:** {str(e_search)}<br>{DOC_BUG}"
                                     answer_md.style("display: none")
                                     return
@@ -178,23 +200,27 @@ def create_chat_page(
                             try:
                                 if priority_results:
                                     answer = priority_results[0].payload.get("document")
-                                else: 
-                                    answer = await ask_llm(
+                                else:
+                                    # Render the answer as it streams in
+                                    answer = ""
+                                    async for delta in ask_llm(
                                         logger=logger,
-                                        llm=llm,
-                                        system_prompt=system_prompt, 
-                                        query=msg, 
+                                        llm=tab.llm,
+                                        system_prompt=system_prompt,
+                                        query=msg,
                                         context=docs,
-                                        history=history, 
+                                        history=history,
                                         results=results,
-                                    )
-                                
+                                    ):
+                                        answer += delta
+                                        answer_md.content = f"{MODEL_RESPOND} {answer}"
+
                                 # Update the UI with the final answer
                                 answer_md.content = f"{MODEL_RESPOND} {answer}"
 
                                 def on_rating_change(rate):
                                     rating_value = rate.value
-                                    logger.info(f"User gave {rating_value} stars")
+                                    logger.info("User gave %s stars", rating_value)
                                     ui.notify(THANKS)
                                     
                                     # Save the rating and answer to the cache
@@ -217,10 +243,10 @@ def create_chat_page(
                                 )
 
                                 history.append((msg, str(answer)))
-                                logger.info(f"Successfully processed message: {str(answer)}")
+                                logger.info("Successfully processed message: %s", answer)
 
                             except Exception as e_model:
-                                logger.error(f"Model error: {str(e_model)}", exc_info=True)
+                                logger.error("Model error: %s", e_model, exc_info=True)
                                 answer_md.content = f"**Ошибка модели:** {str(e_model)}<br>{MODEL_BUG}"
                         
                         finally:
@@ -229,16 +255,6 @@ def create_chat_page(
                             send_btn.props(remove="loading")
                             clear_btn.props(remove="disable")
 
-                            def scroll_to_bottom():
-                                ui.run_javascript("""
-                                    const container = document.querySelector('.overflow-y-auto');
-                                    if (container) {
-                                        container.scrollTop = container.scrollHeight;
-                                    }
-                                """)
-                            
-                            ui.timer(0.1, scroll_to_bottom, once=True)
-
                 async def clear_history() -> None:
                     """Clear chat history"""
                     history.clear()
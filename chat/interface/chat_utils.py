@@ -1,44 +1,50 @@
 from logging import Logger
 
 from functools import lru_cache
-from pymorphy2 import MorphAnalyzer
 
-from databases.searcher.search import HybridHit
+from config.settings import get_morph
+from databases.searcher.searcher_client import HybridHit
 
 
-@lru_cache(maxsize=10000)
-def get_normal_form(word: str, morph: MorphAnalyzer) -> str:
+@lru_cache(maxsize=100_000)
+def get_normal_form(word: str) -> str:
     """
     Caching of popular lemmas to speed up computation.
+    Keyed on the word alone: the process-wide analyzer comes from config.settings.
     :param word: individual word from query
-    :param morph: lemmatizator
     :return: lemmatized (normal) form of the word
     """
-    return morph.parse(word)[0].normal_form
+    return get_morph().parse(word)[0].normal_form
 
 
-def extract_entities(results: list[HybridHit]) -> tuple[set[str], list[str]]:
+@lru_cache(maxsize=4096)
+def _format_display(paths: tuple[str, ...]) -> str:
+    """
+    Memoized links block for a chat message.
+    :param paths: sorted file paths of the found documents
+    :return: formatted list of relevant documents
+    """
+    return "Релевантные документы:\n\n" + "\n\n".join(paths)
+
+
+def extract_entities(results: list[HybridHit]) -> tuple[tuple[str, ...], list[str]]:
     """
     Extract only necessary things from search results.
     :param results: List of result objects
-    :return: A tuple of (set of documents, list of file paths)
+    :return: A tuple of (unique documents in hit order, list of file paths)
     """
-    docs = set()
-    doc_entries = set()
+    docs = {}
+    paths = set()
 
+    # One pass: dict keys dedupe chunk texts in order
     for hit in results:
-        payload = hit.payload  # assuming each result has `.payload` attribute
-        doc = payload.get("document", "")
-        file_path = payload.get("file_path", "—")
-
-        docs.add(doc)
-        doc_entries.add((doc, file_path))
+        docs[hit.document] = None
+        paths.add(hit.file_path)
 
-    paths = list({path for _, path in doc_entries})
-    return docs, paths
+    return tuple(docs), list(paths)
 
 
-async def search_display(results: list[HybridHit], logger: Logger) -> tuple[set[str], str]:
+async def search_display(results: list[HybridHit], logger: Logger) -> tuple[tuple[str, ...], str]:
     """
     Extracting texts for context in prompt and links for message
     :param results: raw search results
@@ -51,7 +57,8 @@ async def search_display(results: list[HybridHit], logger: Logger) -> tuple[set[
         raise ValueError("No relevant documents")
 
     docs, paths = extract_entities(results)
-    display_docs = "Релевантные документы:\n\n" + "\n\n".join(paths)
+    # Sorted so the same set of paths always hits the same cache entry
+    display_docs = _format_display(tuple(sorted(paths)))
     return docs, display_docs
 
 
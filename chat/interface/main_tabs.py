@@ -8,6 +8,12 @@ from config.consts.tab_config import TabConfig
 
 def create_main_menu(tabs: list[TabConfig]):
     """Create main menu page"""
+    # Built once per app, not on every page render
+    nav_items = [
+        (tab.header, functools.partial(ui.navigate.to, f"/{tab.prefix}"), tab.prefix)
+        for tab in tabs
+    ]
+
     @ui.page("/")
     def main_menu():
 
@@ -16,12 +22,11 @@ def create_main_menu(tabs: list[TabConfig]):
             ui.label(MAIN_MENU).classes("text-6xl font-bold mb-10")
                 
             with ui.column().classes("w-[25%] h-[15%] items-center gap-4"):
-                for tab in tabs:
-                    on_click = functools.partial(ui.navigate.to, f"/{tab.prefix}")
-                    with ui.button(f"{tab.header}", on_click=on_click) \
+                for label, on_click, icon in nav_items:
+                    with ui.button(label, on_click=on_click) \
                         .classes("w-[100%] h-[100%] justify-start text-left") \
                         .props("color=primary"):
-                        ui.icon(f"{tab.prefix}").classes("mr-3")
+                        ui.icon(icon).classes("mr-3")
 
 
 def create_api_info():
@@ -0,0 +1,4 @@
+from dotenv import load_dotenv
+
+# Some consts are overridable from the environment and read at import time
+load_dotenv()
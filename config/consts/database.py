@@ -1,20 +1,30 @@
+import os
+
 # Chunk info
 CHUNK_SIZE = 384  # Standard value maybe should replace
 OVERLAP = 1 # one sentence
 # Work with DB
 SCROLL_LIMIT = 1024
 BATCH_SIZE = 64
+INGEST_CONCURRENCY = 4 # Files sent to qdrant-ingester at once
+INDEXING_THRESHOLD = 20000 # Qdrant default, restored after bulk loads
 # PDF reader
 PDF_SIZE_LIMIT = 50
 DPI = 300
 # Embeddings
-DENSE_EMBEDDING_MODEL = "mxbai-embed-large"
+DENSE_EMBEDDING_MODEL = os.getenv("OLLAMA_EMBED_MODEL", "mxbai-embed-large") # Changing it requires re-indexing
 SPARSE_EMBEDDING_MODEL = "Qdrant/bm25"
 LATE_EMBEDDING_MODEL = "colbert-ir/colbertv2.0"
+EMBED_BATCH_SIZE = 32 # Documents per /api/embed request, halved on timeouts
+EMBED_MIN_BATCH = 1
+QUERY_EMBED_CACHE_SIZE = 1024 # Query vectors kept in memory
 
 DENSE_VECTOR_CONFIG = "dense"
 SPARSE_VECTOR_CONFIG = "sparse"
 LATE_VECTOR_CONFIG = "late"
+# Quantization
+QUANTIZATION = "scalar" # "none", "scalar" (int8) or "binary"
+QUANTIZATION_OVERSAMPLING = 2.0 # Candidates fetched per result before rescoring
 
 # Doc info
 FILE_FORMATS = [
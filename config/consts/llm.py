@@ -0,0 +1,31 @@
+import os
+
+import httpx
+
+# Ollama models, q8_0 builds by default; override with the fp16 tags if answers regress
+CHAT_MODEL = os.getenv("OLLAMA_CHAT_MODEL", "qwen3:14b-q8_0")
+CODE_ASSISTANT_MODEL = os.getenv("OLLAMA_CODE_MODEL", "deepseek-coder-v2:16b-lite-instruct-q8_0")
+# Ollama model residency
+KEEP_ALIVE = -1 # Never unload models between requests
+# Shared by the SDK client and the raw embedding client
+OLLAMA_HTTP_TIMEOUT = httpx.Timeout(300.0, connect=10.0)
+OLLAMA_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=40, max_connections=100, keepalive_expiry=30.0)
+# Timeouts, seconds
+CHAT_REQUEST_TIMEOUT = float(os.getenv("OLLAMA_CHAT_TIMEOUT", "60"))
+CODE_ASSISTANT_REQUEST_TIMEOUT = float(os.getenv("OLLAMA_CODE_TIMEOUT", "60"))
+FIRST_TOKEN_TIMEOUT = float(os.getenv("OLLAMA_FIRST_TOKEN_TIMEOUT", "15")) # A stalled generation is restarted after this
+FIRST_TOKEN_RETRIES = 1 # Restarts before waiting up to the full request timeout
+# Ollama LLM settings by tag, see llm.ollama_configs.get_llm
+MODEL_TABLE = {
+    "chat": {
+        "model": CHAT_MODEL,
+        "request_timeout": CHAT_REQUEST_TIMEOUT,
+        "max_tokens": 200,
+    },
+    "code_assistant": {
+        "model": CODE_ASSISTANT_MODEL,
+        "request_timeout": CODE_ASSISTANT_REQUEST_TIMEOUT,
+        "max_tokens": 300,
+        "temperature": 0.5,
+    },
+}
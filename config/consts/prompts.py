@@ -11,3 +11,6 @@ CODER_SYSTEM_PROMPT = (
     "отвечаешь ВСЕГДА только по-русски, даже если вопрос задан на другом языке, "
     "ничего не уточняешь и не переспрашиваешь. "
 )
+
+# Last question/answer pairs passed to the LLM; older turns drop off the prompt
+HISTORY_WINDOW = 5
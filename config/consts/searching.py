@@ -7,6 +7,19 @@ SPARSE_THRESHOLD = 2.0
 THRESHOLD = 0.3 # Empirical
 COSINE_SIMILARITY_THRESHOLD = 0.8
 TOP_K = 10
+SEARCH_CONCURRENCY = 8 # Hybrid searches whose sparse query runs beside the dense one
+SEARCH_CACHE_SIZE = 1024 # Normalized queries kept with their hits
+SEARCH_CACHE_TTL = 300 # Seconds, so re-ingested or deleted documents stop being served
+SPECULATIVE_SEARCH = False # Start RAG search before the cache lookup returns
+# Query normalisation
+USE_RAZDEL = True # False: faster regex tokenizer, but it also splits hyphenated and alphanumeric words
+WARMUP_QUERY = "Какие документы есть в базе знаний?"
+# Semantic answer cache (/api/chat)
+SEMANTIC_CACHE_THRESHOLD = 0.9 # Cosine similarity to reuse a cached answer
+SEMANTIC_CACHE_SIZE = 1024
+SEMANTIC_CACHE_BLOCK = 256 # Cached rows widened to float32 per scoring step
+SEMANTIC_CACHE_TTL = 3600 # Seconds a cached RAG answer stays valid
+CODE_SEMANTIC_CACHE_TTL = 600 # Code answers go stale faster
 # Ragas settings
 MAX_ATTEMPTS = 3
 RELEVANCY_THRESHOLD = 0.7
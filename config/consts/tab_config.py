@@ -3,3 +3,4 @@ class TabConfig:
     header: str = ""
     system_prompt: str = ""
     markdown: str = ""
+    cache_ttl: float = 0.0
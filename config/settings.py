@@ -1,5 +1,6 @@
+from functools import cached_property, lru_cache
+import logging
 import os
-from dotenv import load_dotenv
 
 from pydantic import BaseModel, field as pydantic_field
 from pydantic_settings import BaseSettings
@@ -10,7 +11,7 @@ from stop_words import get_stop_words
 import tiktoken
 
 from llama_index.llms.ollama import Ollama
-from qdrant_client import QdrantClient
+from qdrant_client import AsyncQdrantClient, QdrantClient
 from redis.asyncio import Redis
 
 from config.consts.searching import (
@@ -24,23 +25,71 @@ from config.consts.searching import (
     SPARSE_THRESHOLD,
     THRESHOLD,
     COSINE_SIMILARITY_THRESHOLD,
+    SEARCH_CACHE_SIZE,
+    SEARCH_CACHE_TTL,
+    SPECULATIVE_SEARCH,
+    USE_RAZDEL,
+    SEMANTIC_CACHE_THRESHOLD,
+    SEMANTIC_CACHE_SIZE,
+    SEMANTIC_CACHE_TTL,
+    CODE_SEMANTIC_CACHE_TTL,
+)
+from config.consts.database import (
+    DENSE_EMBEDDING_MODEL,
+    DENSE_VECTOR_CONFIG,
+    SPARSE_VECTOR_CONFIG,
+    LATE_VECTOR_CONFIG,
 )
 from config.consts.prompts import (
+    HISTORY_WINDOW,
     CODER_SYSTEM_PROMPT,
     RAG_SYSTEM_PROMPT,
 )
 from config.consts.tab_config import TabConfig
 from llm.ollama_configs import (
-    chat_llm,
-    code_assistant_llm,
+    get_llm,
+    OllamaDenseEmbedding,
 )
 
-load_dotenv()
+logger = logging.getLogger(__name__)
+
+# Casefolded to match the query tokens it is checked against
+RU_STOPWORDS = frozenset(w.casefold() for w in get_stop_words("ru"))
+
+
+# Heavy NLP singletons are built on first use, not at import time
+@lru_cache(maxsize=None)
+def get_morph() -> MorphAnalyzer:
+    """
+    Shared pymorphy3 analyzer, loaded once on first call.
+    :return: MorphAnalyzer instance
+    """
+    morph = pymorphy3.MorphAnalyzer()
+    # Without the C DAWG extension pymorphy3 silently falls back to dawg_python,
+    # which lemmatises an order of magnitude slower
+    words_dawg = type(morph.dictionary.words)
+    if any(cls.__module__.startswith("dawg_python") for cls in words_dawg.__mro__):
+        logger.warning("pymorphy3 runs on the pure-Python DAWG backend; install pymorphy3[fast]")
+    return morph
+
 
-# Singletons initialised once at import time
-RU_STOPWORDS = set(get_stop_words("ru"))
-morph = pymorphy3.MorphAnalyzer()
-tokenizer = tiktoken.get_encoding("cl100k_base")
+@lru_cache(maxsize=None)
+def get_tokenizer() -> tiktoken.Encoding:
+    """
+    Shared tiktoken encoding, loaded once on first call.
+    :return: cl100k_base encoding
+    """
+    return tiktoken.get_encoding("cl100k_base")
+
+
+@lru_cache(maxsize=None)
+def get_dense_embedding(model_name: str = DENSE_EMBEDDING_MODEL) -> OllamaDenseEmbedding:
+    """
+    Shared dense embedding model per model name, so every config instance reuses it.
+    :param model_name: Ollama embedding model tag
+    :return: OllamaDenseEmbedding instance
+    """
+    return OllamaDenseEmbedding(model_name)
 
 
 class AppConfig(BaseSettings):
@@ -58,6 +107,12 @@ class AppConfig(BaseSettings):
     sparse_threshold: float = SPARSE_THRESHOLD
     threshold: float = THRESHOLD
     cosine_similarity_threshold: float = COSINE_SIMILARITY_THRESHOLD
+    search_cache_size: int = SEARCH_CACHE_SIZE
+    search_cache_ttl: float = SEARCH_CACHE_TTL
+    speculative_search: bool = SPECULATIVE_SEARCH
+    history_window: int = HISTORY_WINDOW
+    semantic_cache_threshold: float = SEMANTIC_CACHE_THRESHOLD
+    semantic_cache_size: int = SEMANTIC_CACHE_SIZE
 
     # External microservice URLs
     qdrant_searcher_url: str = pydantic_field(
@@ -80,6 +135,8 @@ class AppConfig(BaseSettings):
 class ChatRequest(BaseModel):
     question: str
     history: list[tuple[str, str]]
+    stream: bool = False
+    tab: str = "chat" # Tab prefix, selects the model and the cache namespace
 
 
 class DBConfig(BaseSettings):
@@ -99,14 +156,52 @@ class ClientsConfig:
         self,
         host: str = os.getenv("HOST"),
         db_port: str = os.getenv("DB_PORT"),
+        grpc_port: str = os.getenv("GRPC_PORT", "6334"),
         redis_port: str = os.getenv("REDIS_PORT"),
     ):
+        self.host = host
+        self.db_port = db_port
+        self.grpc_port = int(grpc_port)
+        self.redis_port = redis_port
         self.qdrant_url: str = f"http://{host}:{db_port}"
-        self.qdrant_client: QdrantClient = QdrantClient(host, port=db_port)
-        self.redis_client: Redis = Redis(
-            host=host, port=redis_port, db=0, decode_responses=True
+
+    # Clients are created on first access, so a config that is only read
+    # for its URLs never opens connections
+    # gRPC sends vectors as binary protobuf instead of JSON number arrays
+    @cached_property
+    def qdrant_client(self) -> QdrantClient:
+        return QdrantClient(
+            self.host, port=self.db_port, grpc_port=self.grpc_port, prefer_grpc=True
         )
 
+    @cached_property
+    def async_qdrant_client(self) -> AsyncQdrantClient:
+        # Used from the event loop (answer cache) so calls never block it
+        return AsyncQdrantClient(
+            self.host, port=self.db_port, grpc_port=self.grpc_port, prefer_grpc=True
+        )
+
+    @cached_property
+    def redis_client(self) -> Redis:
+        return Redis(
+            host=self.host, port=self.redis_port, db=0, decode_responses=True
+        )
+
+
+class EmbeddingModelsConfig:
+    """
+    Vector names and embedding models used when building collections.
+    Models are instantiated lazily on first access.
+    """
+    def __init__(self):
+        self.dense_vector_config: str = DENSE_VECTOR_CONFIG
+        self.sparse_vector_config: str = SPARSE_VECTOR_CONFIG
+        self.late_vector_config: str = LATE_VECTOR_CONFIG
+
+    @property
+    def dense(self) -> OllamaDenseEmbedding:
+        return get_dense_embedding(DENSE_EMBEDDING_MODEL)
+
 
 class NLPConfig:
     """
@@ -114,9 +209,16 @@ class NLPConfig:
     Lives in app because Dialogue.processing_query() runs per-user-request.
     """
     def __init__(self):
-        self.stopwords: set = RU_STOPWORDS
-        self.morph: MorphAnalyzer = morph
-        self.tokenizer: tiktoken.Encoding = tokenizer
+        self.stopwords: frozenset[str] = RU_STOPWORDS
+        self.use_razdel: bool = USE_RAZDEL
+
+    @cached_property
+    def morph(self) -> MorphAnalyzer:
+        return get_morph()
+
+    @cached_property
+    def tokenizer(self) -> tiktoken.Encoding:
+        return get_tokenizer()
 
 
 class RAGTabConfig(TabConfig):
@@ -124,7 +226,11 @@ class RAGTabConfig(TabConfig):
     header: str = "Чат-бот"
     system_prompt: str = RAG_SYSTEM_PROMPT
     markdown: str = ""
-    llm: Ollama = chat_llm
+    cache_ttl: float = SEMANTIC_CACHE_TTL
+
+    @property
+    def llm(self) -> Ollama:
+        return get_llm("chat")
 
 
 class CodeAssistantTabConfig(TabConfig):
@@ -132,4 +238,8 @@ class CodeAssistantTabConfig(TabConfig):
     header: str = "Код ассистент"
     system_prompt: str = CODER_SYSTEM_PROMPT
     markdown: str = ""
-    llm: Ollama = code_assistant_llm
+    cache_ttl: float = CODE_SEMANTIC_CACHE_TTL
+
+    @property
+    def llm(self) -> Ollama:
+        return get_llm("code_assistant")
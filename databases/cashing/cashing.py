@@ -1,12 +1,14 @@
 """Answer cache: Redis session store + Qdrant upsert via qdrant-ingester."""
 from __future__ import annotations
 
-import json
+import asyncio
 import uuid
 from logging import Logger
 from datetime import datetime
 from uuid import UUID
 
+import orjson
+
 from config.settings import ClientsConfig, AppConfig
 from databases.ingestion.client import IngesterClient
 
@@ -22,7 +24,7 @@ class AnswerCash:
         timeout_minutes: int,
     ) -> None:
         self.logger = logger
-        self.client = clients_config.qdrant_client
+        self.client = clients_config.async_qdrant_client
         self.redis = clients_config.redis_client
         self.collection_name = collection_name
         self.session_id = session_id
@@ -53,7 +55,7 @@ class AnswerCash:
             "timestamp": now,
         }
         self.logger.info("[ADD] Adding entry to %s: rating=%s, question_id=%s", key, rating, question_id)
-        await self.redis.rpush(key, json.dumps(entry))
+        await self.redis.rpush(key, orjson.dumps(entry))
         await self.redis.expire(key, self.timeout_minutes * 60)
 
     async def flush(self, immidiate: bool = False) -> None:
@@ -72,11 +74,14 @@ class AnswerCash:
                 continue
 
             latest_by_question: dict = {}
+            # Parsed timestamp of the kept entry, so each timestamp is parsed once
+            latest_ts: dict = {}
             for raw in raw_messages:
-                msg = json.loads(raw)
+                msg = orjson.loads(raw)
                 qid = msg["question_id"]
                 ts = datetime.fromisoformat(msg["timestamp"])
-                if qid not in latest_by_question or ts > datetime.fromisoformat(latest_by_question[qid]["timestamp"]):
+                if qid not in latest_ts or ts > latest_ts[qid]:
+                    latest_ts[qid] = ts
                     latest_by_question[qid] = msg
 
             qas = [
@@ -100,7 +105,22 @@ class AnswerCash:
     async def save_answer(self, qas: list[dict]) -> None:
         """
         Upsert Q&A pairs into the cache Qdrant collection via qdrant-ingester.
+        Existing points are fetched in one retrieve and upserts run concurrently.
         """
+        question_ids = [qa["question_id"] for qa in qas if qa["question_id"]]
+        current_by_id: dict[str, dict] = {}
+        if question_ids:
+            try:
+                points = await self.client.retrieve(
+                    collection_name=self.collection_name,
+                    ids=question_ids,
+                    with_payload=True,
+                )
+                current_by_id = {str(point.id): point.payload for point in points}
+            except Exception as exc:
+                self.logger.exception("[SAVE] Failed to retrieve cached QAs: %s", exc)
+
+        prepared: list[tuple[str | None, str, dict]] = []
         for qa in qas:
             question = qa["question"]
             question_id = qa["question_id"]
@@ -109,12 +129,7 @@ class AnswerCash:
 
             try:
                 if question_id:
-                    point = self.client.retrieve(
-                        collection_name=self.collection_name,
-                        ids=[question_id],
-                        with_payload=True,
-                    )
-                    current = point[0].payload
+                    current = current_by_id[question_id]
                     count = current.get("rating_count", 0)
                     avg = current.get("rating", 0.0)
                     new_rating = ((avg * count) + rating) / (count + 1)
@@ -140,14 +155,22 @@ class AnswerCash:
                 self.logger.exception("[SAVE] Failed to prepare QA: %s", exc)
                 continue
 
-            try:
-                await self._ingester.ingest_text(
+            prepared.append((question_id, question, payload))
+
+        results = await asyncio.gather(
+            *(
+                self._ingester.ingest_text(
                     collection=self.collection_name,
                     text=question,
                     payload=payload,
                 )
-            except Exception as exc:
-                self.logger.exception("[SAVE] Upsert failed: %s", exc)
+                for _, question, payload in prepared
+            ),
+            return_exceptions=True,
+        )
+
+        for (question_id, _, _), result in zip(prepared, results):
+            if isinstance(result, Exception):
+                self.logger.error("[SAVE] Upsert failed for question_id=%s: %s", question_id, result)
                 continue
-
             self.logger.info("[SAVE] Upsert completed for question_id=%s", question_id)
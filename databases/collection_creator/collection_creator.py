@@ -1,16 +1,14 @@
 import os
 import sys
+from typing import Literal
 
 from qdrant_client.models import models
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
 
+from config.consts.database import QUANTIZATION
 from config.settings import AppConfig, ClientsConfig, EmbeddingModelsConfig
 
-app_config=AppConfig()
-client_config = ClientsConfig()
-embedding_models_config = EmbeddingModelsConfig()
-
 
 class CreateCollection:
     """
@@ -21,6 +19,7 @@ class CreateCollection:
     :param late_embeddings: Optional 3D list of late interaction vectors for multi-vector configuration.
     :param late: Flag to include late interaction vector configuration.
     :param recreation: Whether to recreate the collection (drops and creates anew).
+    :param quantization: Quantization applied to stored vectors: "none", "scalar" (int8) or "binary".
     """
 
     def __init__(
@@ -31,7 +30,8 @@ class CreateCollection:
         dense_embeddings: list[list[float]],
         late_embeddings: list[list[list[float]]] = None,
         sparse: bool = True,
-        recreation: bool = False
+        recreation: bool = False,
+        quantization: Literal["none", "scalar", "binary"] = QUANTIZATION,
     ):
         self.client = client_config.qdrant_client
         self.collection_name = collection_name
@@ -40,6 +40,27 @@ class CreateCollection:
         self.late_embeddings = late_embeddings
         self.sparse = sparse
         self.recreation = recreation
+        self.quantization = quantization
+
+    def quantization_config(self) -> models.QuantizationConfig | None:
+        """
+        Builds the quantization config matching self.quantization.
+        Quantized vectors are kept in RAM, originals are used for rescoring.
+        :return: Qdrant quantization config or None when disabled
+        """
+        if self.quantization == "scalar":
+            return models.ScalarQuantization(
+                scalar=models.ScalarQuantizationConfig(
+                    type=models.ScalarType.INT8,
+                    quantile=0.99,
+                    always_ram=True,
+                )
+            )
+        if self.quantization == "binary":
+            return models.BinaryQuantization(
+                binary=models.BinaryQuantizationConfig(always_ram=True)
+            )
+        return None
 
     def creator(self, configs: dict) -> None:
         """
@@ -51,11 +72,13 @@ class CreateCollection:
                 collection_name=self.collection_name,
                 vectors_config=configs["vectors_config"],
                 sparse_vectors_config=configs["sparse_vectors_config"],
+                quantization_config=configs["quantization_config"],
             )
         else:
             self.client.create_collection(
                 collection_name=self.collection_name,
                 vectors_config=configs["vectors_config"],
+                quantization_config=configs["quantization_config"],
             )
 
     def recreator(self, configs: dict) -> None:
@@ -68,11 +91,13 @@ class CreateCollection:
                 collection_name=self.collection_name,
                 vectors_config=configs["vectors_config"],
                 sparse_vectors_config=configs["sparse_vectors_config"],
+                quantization_config=configs["quantization_config"],
             )
         else:
             self.client.recreate_collection(
                 collection_name=self.collection_name,
                 vectors_config=configs["vectors_config"],
+                quantization_config=configs["quantization_config"],
             )
 
     def build_collection(self,) -> None:
@@ -85,6 +110,8 @@ class CreateCollection:
             self.embedding_models_config.dense_vector_config: models.VectorParams(
                 size=len(self.dense_embeddings[0]),
                 distance=models.Distance.COSINE,
+                # fp16 storage halves dense-vector RAM and transfer size
+                datatype=models.Datatype.FLOAT16,
             )
         }
 
@@ -95,6 +122,8 @@ class CreateCollection:
                 self.embedding_models_config.late_vector_config: models.VectorParams(
                     size=len(self.late_embeddings[0][0]),
                     distance=models.Distance.COSINE,
+                    # Multivectors are only used for rescoring, keep them off RAM
+                    on_disk=True,
                     multivector_config=models.MultiVectorConfig(
                         comparator=models.MultiVectorComparator.MAX_SIM,
                     ),
@@ -104,11 +133,12 @@ class CreateCollection:
         
         configs = {
             "vectors_config": vectors_config,
+            "quantization_config": self.quantization_config(),
         }
 
         if self.sparse:
             sparse_config = {
-            embedding_models_config.sparse_vector_config: models.SparseVectorParams(
+            self.embedding_models_config.sparse_vector_config: models.SparseVectorParams(
                 modifier=models.Modifier.IDF
             ),
             }     
@@ -119,11 +149,23 @@ class CreateCollection:
         else:
             self.creator(configs)
 
+        # Keyword index so file_path lookups (sync, deletion) are indexed matches, not scans
+        self.client.create_payload_index(
+            collection_name=self.collection_name,
+            field_name="file_path",
+            field_schema=models.PayloadSchemaType.KEYWORD,
+        )
+
 
 if __name__ == "__main__":
+    # Configs are built here, not at import, so importing CreateCollection stays cheap
+    app_config = AppConfig()
+    client_config = ClientsConfig()
+    embedding_models_config = EmbeddingModelsConfig()
+
     sample_text = "Hello World"
     dense_embeddings = list(embedding_models_config.dense.embed(sample_text))
-    collections = [app_config.cash_collection, app_config.rag_collection, app_config.mech_collection]
+    collections = [app_config.cash_collection, app_config.rag_collection]
     for collection_name in collections:
         if not client_config.qdrant_client.collection_exists(collection_name):
             CreateCollection(
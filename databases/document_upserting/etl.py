@@ -9,8 +9,11 @@ import logging
 import os
 from pathlib import Path
 
+from qdrant_client import AsyncQdrantClient, models
+
 from databases.ingestion.client import IngesterClient
-from config.consts.database import FILE_FORMATS
+from config.consts.database import FILE_FORMATS, INDEXING_THRESHOLD
+from config.settings import ClientsConfig
 
 LOG_DIR = "/app/logs"
 os.makedirs(LOG_DIR, exist_ok=True)
@@ -26,6 +29,47 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+async def pause_indexing(
+    client: AsyncQdrantClient,
+    collections: list[str],
+    previous: dict[str, int],
+) -> None:
+    """
+    Stop HNSW indexing on the given collections for the duration of a bulk load.
+    A threshold is saved before its collection is updated, so a failure part-way
+    still leaves every paused collection in previous for restore_indexing.
+    :param client: Async Qdrant client
+    :param collections: names of collections about to receive documents
+    :param previous: filled with the previous indexing_threshold per collection
+    """
+    for name in collections:
+        if not await client.collection_exists(name):
+            continue
+        info = await client.get_collection(name)
+        # None would mean "unchanged" in the restoring diff, so fall back to Qdrant's default
+        threshold = info.config.optimizer_config.indexing_threshold
+        previous[name] = INDEXING_THRESHOLD if threshold is None else threshold
+        await client.update_collection(
+            collection_name=name,
+            optimizers_config=models.OptimizersConfigDiff(indexing_threshold=0),
+        )
+        logger.info("Indexing paused for '%s'", name)
+
+
+async def restore_indexing(client: AsyncQdrantClient, previous: dict[str, int]) -> None:
+    """
+    Restore indexing thresholds saved by pause_indexing, so the index is built once.
+    :param client: Async Qdrant client
+    :param previous: indexing_threshold per collection
+    """
+    for name, threshold in previous.items():
+        await client.update_collection(
+            collection_name=name,
+            optimizers_config=models.OptimizersConfigDiff(indexing_threshold=threshold),
+        )
+        logger.info("Indexing restored for '%s' (threshold=%s)", name, threshold)
+
+
 async def main() -> None:
     ingester_url = os.environ["QDRANT_INGESTER_URL"]
     folder_path = Path(__file__).parent.parent / "documents"
@@ -33,10 +77,19 @@ async def main() -> None:
     logger.info("Starting ETL: folder=%s, ingester=%s", folder_path, ingester_url)
 
     client = IngesterClient(base_url=ingester_url)
-    totals = await client.ingest_folder(
-        folder_path=folder_path,
-        allowed_formats=set(FILE_FORMATS),
-    )
+    qdrant_client = ClientsConfig().async_qdrant_client
+    # Each top-level subfolder is ingested into the collection of the same name
+    collections = [p.name for p in folder_path.iterdir() if p.is_dir()]
+    # Without this the optimizer rebuilds HNSW segments while points keep arriving
+    previous: dict[str, int] = {}
+    try:
+        await pause_indexing(qdrant_client, collections, previous)
+        totals = await client.ingest_folder(
+            folder_path=folder_path,
+            allowed_formats=set(FILE_FORMATS),
+        )
+    finally:
+        await restore_indexing(qdrant_client, previous)
 
     for collection, count in totals.items():
         logger.info("Collection '%s': %d chunks upserted", collection, count)
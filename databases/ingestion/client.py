@@ -1,12 +1,15 @@
 """HTTP client for qdrant-ingester microservice."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from collections import defaultdict
 from pathlib import Path
 
 import httpx
 
+from config.consts.database import INGEST_CONCURRENCY
+
 logger = logging.getLogger(__name__)
 
 
@@ -108,6 +111,7 @@ class IngesterClient:
         allowed_formats: set[str] | None = None,
         chunk_size: int | None = None,
         overlap: int | None = None,
+        concurrency: int = INGEST_CONCURRENCY,
     ) -> dict[str, int]:
         files_by_collection: dict[str, list[Path]] = defaultdict(list)
         for path in folder_path.rglob("*"):
@@ -122,11 +126,12 @@ class IngesterClient:
                 continue
             files_by_collection[collection_name].append(path)
 
-        totals: dict[str, int] = {}
-        for collection, file_paths in files_by_collection.items():
-            new_paths, deleted = await self.sync_collection(collection, set(file_paths))
-            upserted = 0
-            for fp in new_paths:
+        # Several files in flight overlap chunking, embedding and upserts in
+        # the downstream services; the semaphore keeps them from being flooded
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def ingest_one(collection: str, fp: Path) -> int:
+            async with semaphore:
                 try:
                     result = await self.ingest_file(
                         collection=collection,
@@ -134,7 +139,7 @@ class IngesterClient:
                         chunk_size=chunk_size,
                         overlap=overlap,
                     )
-                    upserted += result.get("chunks_upserted", 0)
+                    return result.get("chunks_upserted", 0)
                 except httpx.HTTPStatusError as e:
                     logger.error(
                         "Ingest failed for %s [HTTP %d]: %s",
@@ -142,6 +147,13 @@ class IngesterClient:
                     )
                 except Exception as e:
                     logger.error("Ingest failed for %s: %s", fp.name, e)
+                return 0
+
+        totals: dict[str, int] = {}
+        for collection, file_paths in files_by_collection.items():
+            new_paths, deleted = await self.sync_collection(collection, set(file_paths))
+            counts = await asyncio.gather(*(ingest_one(collection, fp) for fp in new_paths))
+            upserted = sum(counts)
             totals[collection] = upserted
             logger.info(
                 "Collection '%s': %d new, %d upserted, %d orphans deleted",
@@ -1,23 +1,21 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
-from dataclasses import dataclass
 from typing import Optional
 
+import numpy as np
 from qdrant_client import QdrantClient, models
 from qdrant_client.http.models import SparseVector
 
+from config.consts.database import QUANTIZATION_OVERSAMPLING
+from config.consts.searching import SEARCH_CONCURRENCY
 from config.settings import AppConfig, EmbeddingModelsConfig
+from databases.searcher.searcher_client import HybridHit
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass
-class HybridHit:
-    """Search result with structured data."""
-    id: str
-    score: float
-    source: str
-    payload: dict
+# Runs the sparse query of each hybrid search while the caller's thread runs the dense one
+QUERY_POOL = ThreadPoolExecutor(max_workers=SEARCH_CONCURRENCY, thread_name_prefix="qdrant-query")
 
 
 def normalize_scores(scores: list[float]) -> list[float]:
@@ -29,13 +27,14 @@ def normalize_scores(scores: list[float]) -> list[float]:
     if not scores:
         raise ValueError("Empty scores list")
 
-    min_score = min(scores)
-    max_score = max(scores)
+    arr = np.asarray(scores, dtype=np.float32)
+    min_score = arr.min()
+    max_score = arr.max()
 
     if max_score == min_score:
-        return [1.0] * len(scores)
+        return [1.0] * arr.size
 
-    return [(s - min_score) / (max_score - min_score) for s in scores]
+    return ((arr - min_score) / (max_score - min_score)).tolist()
 
 
 def run_query(
@@ -61,6 +60,13 @@ def run_query(
             using=using,
             limit=limit,
             with_payload=True,
+            # Search quantized vectors, then rescore the oversampled candidates
+            search_params=models.SearchParams(
+                quantization=models.QuantizationSearchParams(
+                    rescore=True,
+                    oversampling=QUANTIZATION_OVERSAMPLING,
+                )
+            ),
         )
         return response.points
     except Exception as e:
@@ -83,16 +89,14 @@ def hybrid_search_engine(
     :param collection: Name of the Qdrant collection
     :param dense_vectors: Dense vector for prefetch search
     :param sparse_vectors: Sparse vector for prefetch search
-    :param late_vectors: Vector for final reranking (late interaction)
+    :param late_vectors: Vector for final reranking (late interaction); without it
+        the prefetches are fused server-side with DBSF
     :return: list of scored points returned by Qdrant
-    :raise: ValueError: If no vectors provided or late_vectors missing
+    :raise: ValueError: If no vectors provided
     """
     if not any([dense_vectors, sparse_vectors]):
         raise ValueError("At least dense or sparse vectors must be provided")
 
-    if not late_vectors:
-        raise ValueError("Late vectors are required for late interaction search")
-
     prefetch = []
 
     if dense_vectors:
@@ -109,14 +113,24 @@ def hybrid_search_engine(
             limit=app_config.sparse_limit,
         ))
 
-    response = client.query_points(
-        collection_name=collection,
-        prefetch=prefetch,
-        query=late_vectors,
-        using=embedding_models_config.late_vector_config,
-        with_payload=True,
-        limit=app_config.late_limit,
-    )
+    if late_vectors:
+        response = client.query_points(
+            collection_name=collection,
+            prefetch=prefetch,
+            query=late_vectors,
+            using=embedding_models_config.late_vector_config,
+            with_payload=True,
+            limit=app_config.late_limit,
+        )
+    else:
+        # Fusion runs in Qdrant, only the fused top hits come back over the wire
+        response = client.query_points(
+            collection_name=collection,
+            prefetch=prefetch,
+            query=models.FusionQuery(fusion=models.Fusion.DBSF),
+            with_payload=True,
+            limit=app_config.late_limit,
+        )
 
     return response.points
 
@@ -154,19 +168,17 @@ def combined_dense_sparse_scores(
     if dense_empty and sparse_empty:
         raise ValueError("At least one of dense or sparse vectors must be provided")
 
-    dense_hits = [
-        hit for hit in run_query(
-            client, collection, dense_vectors, embedding_models_config.dense_vector_config, app_config.dense_limit
-        )
-        if hit.score >= dense_threshold
-    ]
+    # Independent round-trips: wall time is max(dense, sparse), not the sum.
+    # Only one pool job per search, so concurrent searches do not queue on each other's halves
+    sparse_future = QUERY_POOL.submit(
+        run_query, client, collection, sparse_vectors, embedding_models_config.sparse_vector_config, app_config.sparse_limit
+    )
+    dense_points = run_query(
+        client, collection, dense_vectors, embedding_models_config.dense_vector_config, app_config.dense_limit
+    )
 
-    sparse_hits = [
-        hit for hit in run_query(
-            client, collection, sparse_vectors, embedding_models_config.sparse_vector_config, app_config.sparse_limit
-        )
-        if hit.score >= sparse_threshold
-    ]
+    dense_hits = [hit for hit in dense_points if hit.score >= dense_threshold]
+    sparse_hits = [hit for hit in sparse_future.result() if hit.score >= sparse_threshold]
 
     if not dense_hits and not sparse_hits:
         logger.warning("No relevant dense or sparse results above thresholds — returning empty list.")
@@ -174,59 +186,53 @@ def combined_dense_sparse_scores(
 
     logger.info(f"Dense hits: {len(dense_hits)}, Sparse hits: {len(sparse_hits)}")
 
-    scores: dict[str, dict] = {}
+    # Structure of arrays: one slot per unique point id, dense hits first so
+    # their payload wins, scores scattered into flat arrays
+    index: dict[str, int] = {}
+    payloads: list[dict] = []
+    for hit in (*dense_hits, *sparse_hits):
+        sid = str(hit.id)
+        if sid not in index:
+            index[sid] = len(payloads)
+            payloads.append(hit.payload)
+
+    n = len(payloads)
+    dense_scores = np.zeros(n, dtype=np.float32)
+    sparse_scores = np.zeros(n, dtype=np.float32)
+    raw_dense = np.zeros(n, dtype=np.float64)
+    raw_sparse = np.zeros(n, dtype=np.float64)
 
-    # Process dense hits (only if not empty)
     if dense_hits:
-        dense_raw_scores = {str(hit.id): hit.score for hit in dense_hits}
-        dense_scores = normalize_scores([hit.score for hit in dense_hits])
-
-        for i, hit in enumerate(dense_hits):
-            sid = str(hit.id)
-            scores[sid] = {
-                "dense": dense_scores[i],
-                "sparse": 0.0,
-                "raw_dense": dense_raw_scores[sid],
-                "raw_sparse": 0.0,
-                "payload": hit.payload,
-            }
-
-    # Process sparse hits (only if not empty)
+        idx = [index[str(hit.id)] for hit in dense_hits]
+        raw = [hit.score for hit in dense_hits]
+        dense_scores[idx] = normalize_scores(raw)
+        raw_dense[idx] = raw
+
     if sparse_hits:
-        sparse_raw_scores = {str(hit.id): hit.score for hit in sparse_hits}
-        sparse_scores = normalize_scores([hit.score for hit in sparse_hits])
-
-        for i, hit in enumerate(sparse_hits):
-            sid = str(hit.id)
-            if sid not in scores:
-                scores[sid] = {
-                    "dense": 0.0,
-                    "raw_dense": 0.0,
-                    "payload": hit.payload,
-                }
-            scores[sid]["sparse"] = sparse_scores[i]
-            scores[sid]["raw_sparse"] = sparse_raw_scores[sid]
+        idx = [index[str(hit.id)] for hit in sparse_hits]
+        raw = [hit.score for hit in sparse_hits]
+        sparse_scores[idx] = normalize_scores(raw)
+        raw_sparse[idx] = raw
+
     # Calculate hybrid scores
-    results = []
-    for sid, data in scores.items():
-        dense_score = data.get("dense", 0.0)
-        sparse_score = data.get("sparse", 0.0)
-        hybrid_score = alpha * dense_score + (1 - alpha) * sparse_score
-
-        if hybrid_score >= threshold:
-            results.append(HybridHit(
-                id=sid,
-                score=hybrid_score,
-                source="dense" if dense_score >= sparse_score else "sparse",
-                payload={
-                    **data["payload"],
-                    "_dense_score": data.get("raw_dense", 0.0),
-                    "_sparse_score": data.get("raw_sparse", 0.0),
-                }
-            ))
-
-    results.sort(key=lambda x: x.score, reverse=True)
-    return results[:top_k]
+    hybrid = alpha * dense_scores + (1 - alpha) * sparse_scores
+    passed = np.flatnonzero(hybrid >= threshold)
+    order = passed[np.argsort(-hybrid[passed], kind="stable")][:top_k]
+
+    ids = list(index)
+    return [
+        HybridHit(
+            id=ids[i],
+            score=float(hybrid[i]),
+            source="dense" if dense_scores[i] >= sparse_scores[i] else "sparse",
+            payload={
+                **payloads[i],
+                "_dense_score": float(raw_dense[i]),
+                "_sparse_score": float(raw_sparse[i]),
+            },
+        )
+        for i in order
+    ]
 
 
 def dense_search(
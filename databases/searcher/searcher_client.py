@@ -2,20 +2,32 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 
 import httpx
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class HybridHit:
-    """Mirror of qdrant-searcher's HybridHit schema."""
+    """
+    Mirror of qdrant-searcher's HybridHit schema.
+    document and file_path are lifted out of the payload once, at construction.
+    """
     id: str
     score: float
     source: str
     payload: dict
+    document: str = field(init=False)
+    file_path: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.document = str(self.payload.get("document") or "")
+        # Many chunks share a file: intern so they share one path string.
+        # str() first: non-string payload values would break sorting and joining downstream
+        self.file_path = sys.intern(str(self.payload.get("file_path") or "—"))
 
 
 class SearcherClient:
@@ -36,6 +48,22 @@ class SearcherClient:
     def __init__(self, base_url: str, timeout: float = 30.0) -> None:
         self._base = base_url.rstrip("/")
         self._timeout = timeout
+        self._client: httpx.AsyncClient | None = None
+
+    @property
+    def _http(self) -> httpx.AsyncClient:
+        """
+        One keep-alive connection pool per SearcherClient: every search of a
+        turn reuses an open socket instead of paying connection setup again.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=self._timeout)
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def search(
         self,
@@ -50,8 +78,7 @@ class SearcherClient:
             "collection_name": collection_name,
             "top_k": top_k,
         }
-        async with httpx.AsyncClient(timeout=self._timeout) as http:
-            response = await http.post(f"{self._base}/vector_search", json=payload)
+        response = await self._http.post(f"{self._base}/vector_search", json=payload)
         response.raise_for_status()
         data = response.json()
         hits = [
@@ -71,8 +98,7 @@ class SearcherClient:
 
     async def health(self) -> bool:
         try:
-            async with httpx.AsyncClient(timeout=5.0) as http:
-                r = await http.get(f"{self._base}/health")
+            r = await self._http.get(f"{self._base}/health", timeout=5.0)
             return r.status_code == 200
         except Exception:
             return False
@@ -1,9 +1,28 @@
+import asyncio
+from collections import OrderedDict
+import functools
+import logging
+import threading
+
+import httpx
 import ollama
+import orjson
 from llama_index.llms.ollama import Ollama
 from llama_index.core import PromptTemplate
 import numpy as np
 from typing import Any, Iterable, Union
 
+from config.consts.database import (
+    DENSE_EMBEDDING_MODEL,
+    EMBED_BATCH_SIZE,
+    EMBED_MIN_BATCH,
+    QUERY_EMBED_CACHE_SIZE,
+)
+from config.consts.llm import KEEP_ALIVE, MODEL_TABLE, OLLAMA_HTTP_LIMITS, OLLAMA_HTTP_TIMEOUT
+from config.consts.searching import WARMUP_QUERY
+
+logger = logging.getLogger(__name__)
+
 PROMPT_TEMPLATE = PromptTemplate("""
     Системное сообщение:
     {system}
@@ -19,32 +38,120 @@ PROMPT_TEMPLATE = PromptTemplate("""
 """.strip())
 
 
+@functools.cache
+def get_ollama_client() -> ollama.Client:
+    """
+    Process-wide Ollama client: one keep-alive connection pool shared by all embedding calls.
+    Host comes from OLLAMA_HOST, as with the module-level ollama functions.
+    :return: ollama.Client instance
+    """
+    return ollama.Client(
+        timeout=OLLAMA_HTTP_TIMEOUT,
+        limits=OLLAMA_HTTP_LIMITS,
+    )
+
+
+def get_ollama_http() -> httpx.Client:
+    """
+    The shared client's own connection pool, for the embedding hot path where the SDK's
+    JSON decoding and model validation of long float lists cost more than the request.
+    Its base URL is OLLAMA_HOST as parsed by the SDK (scheme and default port 11434 added).
+    :return: httpx.Client of get_ollama_client()
+    """
+    return get_ollama_client()._client
+
+
 class OllamaDenseEmbedding:
     """
     Custom methods override for fastembed methods
     """
-    def __init__(self, model_name: str):
+    def __init__(
+        self,
+        model_name: str,
+        batch_size: int = EMBED_BATCH_SIZE,
+        min_batch: int = EMBED_MIN_BATCH,
+        query_cache_size: int = QUERY_EMBED_CACHE_SIZE,
+    ):
         self.model_name = model_name
+        self.batch_size = batch_size
+        self.min_batch = min_batch
+        self.query_cache_size = query_cache_size
+        self._query_cache: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._query_lock = threading.Lock()
+        self._query_hits = 0
+        self._query_misses = 0
+
+    def _embed_batch(self, batch: list[str]) -> np.ndarray:
+        """
+        Embeds one slice of documents in a single request.
+        :param batch: documents to embed
+        :returns: A ``(len(batch), d)`` ``np.float32`` array of L2-normalised rows.
+        """
+        resp = get_ollama_http().post(
+            "/api/embed",
+            content=orjson.dumps({"model": self.model_name, "input": batch, "keep_alive": KEEP_ALIVE}),
+            headers={"Content-Type": "application/json"},
+        )
+        if resp.status_code == 404 and b"model" not in resp.content:
+            # Older Ollama servers only expose the single-prompt endpoint: rows are
+            # written into one buffer sized from the first response
+            client = get_ollama_client()
+            vectors = None
+            for i, doc in enumerate(batch):
+                row = client.embeddings(model=self.model_name, prompt=doc, keep_alive=KEEP_ALIVE)["embedding"]
+                if vectors is None:
+                    vectors = np.empty((len(batch), len(row)), dtype=np.float32)
+                vectors[i] = row
+        else:
+            if resp.is_error:
+                # Same error type as the SDK, so embed() keeps its retry policy
+                raise ollama.ResponseError(resp.text, resp.status_code)
+            vectors = np.asarray(orjson.loads(resp.content)["embeddings"], dtype=np.float32)
+        # Unit rows turn cosine similarity into a plain dot product downstream
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True).clip(min=1e-12)
+        return vectors
 
     def embed(
         self,
         documents: str | Iterable[str],
-    ) -> Iterable[np.ndarray]:
+    ) -> np.ndarray:
         """
         Method override for common API using
+        Documents are sent in slices of up to batch_size; a slice that times out or
+        hits a server error is halved and retried, and the size grows back on success.
         :param documents: A single document (str) or an iterable of documents (each a str) to embed.
-        :returns: An iterable of NumPy arrays: each element is the embedding vector for the
-        corresponding input document. Vectors are ``np.float32``.
+        :returns: A ``(N, d)`` ``np.float32`` array of L2-normalised rows, one per input document.
         """
         if isinstance(documents, str):
             documents = [documents]
+        documents = list(documents)
+
+        n = len(documents)
+        out: np.ndarray | None = None
+        batch_size = self.batch_size
+        start = 0
+        while start < n:
+            batch = documents[start:start + batch_size]
+            try:
+                vectors = self._embed_batch(batch)
+            except (httpx.TimeoutException, ollama.ResponseError) as exc:
+                retryable = not isinstance(exc, ollama.ResponseError) or exc.status_code >= 500
+                if not retryable or batch_size <= self.min_batch:
+                    raise
+                batch_size = max(self.min_batch, batch_size // 2)
+                logger.warning("Embedding batch failed (%s), retrying with batch_size=%d", exc, batch_size)
+                continue
 
-        embeddings = []
-        for doc in documents:
-            resp = ollama.embeddings(model=self.model_name, prompt=doc)
-            embeddings.append(np.array(resp["embedding"], dtype=np.float32))
+            # Output is allocated once the first batch reveals the dimension
+            if out is None:
+                out = np.empty((n, vectors.shape[1]), dtype=np.float32)
+            out[start:start + len(batch)] = vectors
+            start += len(batch)
+            batch_size = min(self.batch_size, batch_size * 2)
 
-        return embeddings
+        if out is None:
+            return np.empty((0, 0), dtype=np.float32)
+        return out
     
     def query_embed(
         self, 
@@ -53,26 +160,80 @@ class OllamaDenseEmbedding:
     ) -> Iterable[np.ndarray]:
         """
         Embeds queries, method override for common API
+        Repeated queries are served from an in-process LRU cache.
         query: The query to embed, or an iterable e.g. list of queries
         :returns: An iterable of NumPy arrays: each element is the embedding vector for the
-        corresponding input document. Vectors are ``np.float32``.
+        corresponding input document. Vectors are ``np.float32`` and read-only.
         """
         if isinstance(query, str):
-            yield from self.embed([query], **kwargs)
-        else:
-            yield from self.embed(query, **kwargs)
+            query = [query]
+        for q in query:
+            yield self._cached_query_vector(q)
 
+    def _cached_query_vector(self, query: str) -> np.ndarray:
+        """
+        LRU lookup keyed on the stripped, lowercased query; embeds on a miss.
+        :param query: query text
+        :return: embedding vector shared with the cache
+        """
+        key = query.strip().lower()
+        with self._query_lock:
+            vector = self._query_cache.get(key)
+            if vector is not None:
+                self._query_cache.move_to_end(key)
+                self._query_hits += 1
+                return vector
+            self._query_misses += 1
 
-# Models initialization
-chat_llm = Ollama(
-    model="qwen3:14b",
-    request_timeout=60.0,
-    max_tokens=200,
-)
+        # Embedded outside the lock so concurrent misses do not serialise on Ollama
+        vector = self.embed([key])[0]
+        vector.flags.writeable = False
+        with self._query_lock:
+            self._query_cache[key] = vector
+            self._query_cache.move_to_end(key)
+            if len(self._query_cache) > self.query_cache_size:
+                self._query_cache.popitem(last=False)
+        return vector
 
-code_assistant_llm = Ollama(
-    model="deepseek-coder-v2:16b",
-    request_timeout=60.0,
-    max_tokens=300,
-    temperature=0.5
-)
+    def cache_info(self) -> dict[str, int]:
+        """
+        Query embedding cache statistics.
+        :return: hits, misses, current size and max size
+        """
+        with self._query_lock:
+            return {
+                "hits": self._query_hits,
+                "misses": self._query_misses,
+                "size": len(self._query_cache),
+                "maxsize": self.query_cache_size,
+            }
+
+
+@functools.lru_cache(maxsize=None)
+def get_llm(tag: str) -> Ollama:
+    """
+    Models initialization: created on first use, then shared by every caller.
+    :param tag: key of MODEL_TABLE, e.g. "chat" or "code_assistant"
+    :return: Ollama LLM instance
+    """
+    return Ollama(keep_alive=KEEP_ALIVE, **MODEL_TABLE[tag])
+
+
+async def warmup_models() -> None:
+    """
+    Load the dense embedding and both LLMs into Ollama before the first request,
+    so no user pays the model load. keep_alive keeps them resident afterwards,
+    so switching tabs does not evict one LLM for the other.
+    """
+    client = get_ollama_client()
+    try:
+        await asyncio.to_thread(
+            client.embed, model=DENSE_EMBEDDING_MODEL, input=WARMUP_QUERY, keep_alive=KEEP_ALIVE
+        )
+        # An empty prompt only loads the model, nothing is generated
+        for tag in MODEL_TABLE:
+            await asyncio.to_thread(
+                client.generate, model=MODEL_TABLE[tag]["model"], prompt="", keep_alive=KEEP_ALIVE
+            )
+    except Exception as exc:
+        logger.warning("Ollama warm-up failed: %s", exc)
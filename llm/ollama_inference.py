@@ -1,10 +1,27 @@
 import asyncio
 import re
+from typing import AsyncIterator, Collection
 
 from llama_index.llms.ollama import Ollama
 
+from config.consts.llm import FIRST_TOKEN_RETRIES, FIRST_TOKEN_TIMEOUT
 from llm.ollama_configs import PROMPT_TEMPLATE
 
+THINK_RE = re.compile(r"(?s)^\s*<think>.*?</think>\s*")
+THINK_OPEN = "<think>"
+
+
+def visible_text(text: str) -> str:
+    """
+    Strip the leading <think> block from a (possibly partial) model response.
+    :param text: raw text generated so far
+    :return: text safe to show; empty while a <think> block is still open
+    """
+    head = text.lstrip()
+    if THINK_OPEN.startswith(head) or (head.startswith(THINK_OPEN) and "</think>" not in head):
+        return ""
+    return THINK_RE.sub("", text)
+
 
 async def ask_llm(
     logger,
@@ -12,17 +29,17 @@ async def ask_llm(
     system_prompt: str,
     query: str,
     context: list[str],
-    history: list[tuple[str, str]],
+    history: Collection[tuple[str, str]],
     results,  # reserved for future RAGAS implementation
-) -> str:
+) -> AsyncIterator[str]:
     """
-    Generate a response from the LLM given a user query, context, and history.
+    Stream a response from the LLM given a user query, context, and history.
     :param logger: Logger instance for logging events.
     :param query: The user's current question or message.
     :param context: Retrieved documents or external context for the LLM.
-    :param history: List of previous user–bot interaction pairs.
+    :param history: Recent user–bot interaction pairs, oldest first.
     :param results: Placeholder for future RAGAS-compatible results.
-    :return: Cleaned string response generated by the LLM.
+    :yield: Cleaned text deltas as the model generates them.
     """
     # Convert context and history to plain text strings
     context_text = "\n".join(context) if context else "—"
@@ -34,14 +51,36 @@ async def ask_llm(
         history=history_text,
         query=query,
     )
-    logger.info("ask_llm: prompt=%r", prompt.replace("\n", "\\n"))
-    # Generate a raw response from the model in a background thread
-    response_obj = await asyncio.to_thread(lambda: llm.complete(prompt))
-    # Try extracting the actual text response
-    text = getattr(response_obj, "text", None) or getattr(response_obj.message, "content", str(response_obj))
+    # %r already escapes newlines; formatting is deferred until the record is emitted
+    logger.info("ask_llm: prompt=%r", prompt)
+    for attempt in range(FIRST_TOKEN_RETRIES + 1):
+        stream = await llm.astream_complete(prompt)
+        first = anext(stream, None)
+        if attempt == FIRST_TOKEN_RETRIES:
+            # Last try: no first-token deadline, only the per-read request_timeout
+            chunk = await first
+            break
+        try:
+            # A cold-tail generation is restarted instead of waited out; the timeout
+            # cancels the pending read, which closes the HTTP response so Ollama
+            # stops generating it before the retry is sent
+            chunk = await asyncio.wait_for(first, timeout=FIRST_TOKEN_TIMEOUT)
+            break
+        except asyncio.TimeoutError:
+            await stream.aclose()
+            logger.warning("ask_llm: no token after %.0fs, retrying (attempt %d)", FIRST_TOKEN_TIMEOUT, attempt + 1)
+    text = ""
+    emitted = 0
+    try:
+        while chunk is not None:
+            text += chunk.delta or ""
+            # Hold back special tokens (e.g., <think>) and yield only the new visible part
+            visible = visible_text(text)
+            if len(visible) > emitted:
+                yield visible[emitted:]
+                emitted = len(visible)
+            chunk = await anext(stream, None)
+    finally:
+        # Also ends the generation when the consumer stops early
+        await stream.aclose()
     logger.info("ask_llm: got response text=%r", text)
-    # Remove any special tokens (e.g., <think>) and return cleaned response
-    response = re.sub(r'(?s)^<think>.*?</think>\s*', '', text)
-    logger.info("final_response=%r", response)
-
-    return response
@@ -0,0 +1,129 @@
+import threading
+import time
+
+import numpy as np
+
+from config.consts.searching import SEMANTIC_CACHE_BLOCK, SEMANTIC_CACHE_SIZE, SEMANTIC_CACHE_THRESHOLD
+
+
+class SemanticLLMCache:
+    """
+    Cosine-similarity cache of LLM answers and their sources keyed by query embeddings.
+    A new query whose embedding is close enough to a cached one reuses that answer,
+    skipping retrieval and generation. Entries live in a fixed-size ring buffer,
+    each tagged with a namespace (one per tab) and an expiry time.
+    :param threshold: minimum cosine similarity for a hit
+    :param max_size: number of cached answers, oldest are overwritten first
+    """
+
+    def __init__(
+        self,
+        threshold: float = SEMANTIC_CACHE_THRESHOLD,
+        max_size: int = SEMANTIC_CACHE_SIZE,
+    ) -> None:
+        self.threshold = threshold
+        self.max_size = max_size
+        # (max_size, d) int8 codes with a per-row scale, allocated when the
+        # first embedding reveals d: a quarter of the float32 footprint
+        self._codes: np.ndarray | None = None
+        # Reused float32 scratch for one block of codes, see lookup
+        self._block: np.ndarray | None = None
+        self._scales = np.zeros(max_size, dtype=np.float32)
+        # (answer, display_docs) per slot
+        self._responses: list[tuple[str, str] | None] = [None] * max_size
+        # Namespaces are mapped to small ints so a lookup masks them in one comparison
+        self._namespace_ids: dict[str, int] = {}
+        self._tags = np.full(max_size, -1, dtype=np.int32)
+        self._expires = np.zeros(max_size, dtype=np.float64)
+        self._size = 0
+        self._next = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _unit(embedding: np.ndarray) -> np.ndarray:
+        """
+        L2-normalise so a dot product is the cosine similarity.
+        :param embedding: raw embedding vector
+        :return: float32 unit vector
+        """
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    @staticmethod
+    def _quantize(vector: np.ndarray) -> tuple[np.ndarray, float]:
+        """
+        Symmetric int8 quantization with one scale per vector.
+        :param vector: float32 vector
+        :return: int8 codes and the scale that maps them back
+        """
+        scale = float(np.abs(vector).max()) / 127 or 1.0
+        codes = np.round(vector / scale).astype(np.int8)
+        return codes, scale
+
+    def lookup(self, embedding: np.ndarray, namespace: str) -> tuple[str, str] | None:
+        """
+        Find the cached answer closest to the query within a namespace.
+        :param embedding: query embedding
+        :param namespace: cache partition, answers never cross namespaces
+        :return: cached answer and its display_docs if the similarity passes the threshold, else None
+        """
+        query = self._unit(embedding)
+        with self._lock:
+            tag = self._namespace_ids.get(namespace)
+            if not self._size or tag is None:
+                return None
+            tags = self._tags[:self._size]
+            expired = (tags >= 0) & (self._expires[:self._size] <= time.monotonic())
+            if expired.any():
+                # Lazy eviction: free the answers and retire the slots
+                for i in np.flatnonzero(expired):
+                    self._responses[i] = None
+                tags[expired] = -1
+            valid = tags == tag
+            if not valid.any():
+                return None
+            # NumPy has no int8-accumulating matmul, so codes are widened block by
+            # block into a fixed scratch buffer instead of copying the whole matrix
+            scores = np.empty(self._size, dtype=np.float32)
+            for start in range(0, self._size, SEMANTIC_CACHE_BLOCK):
+                stop = min(start + SEMANTIC_CACHE_BLOCK, self._size)
+                block = self._block[:stop - start]
+                np.copyto(block, self._codes[start:stop])
+                np.matmul(block, query, out=scores[start:stop])
+            scores *= self._scales[:self._size]
+            scores[~valid] = -np.inf
+            best = int(np.argmax(scores))
+            if scores[best] >= self.threshold:
+                return self._responses[best]
+        return None
+
+    def add(
+        self,
+        embedding: np.ndarray,
+        response: str,
+        display_docs: str,
+        namespace: str,
+        ttl: float,
+    ) -> None:
+        """
+        Cache an answer, overwriting the oldest entry when full.
+        :param embedding: query embedding
+        :param response: generated answer
+        :param display_docs: rendered sources shown with the answer
+        :param namespace: cache partition the answer belongs to
+        :param ttl: seconds the answer stays valid
+        """
+        query = self._unit(embedding)
+        with self._lock:
+            if self._codes is None:
+                self._codes = np.empty((self.max_size, query.shape[0]), dtype=np.int8)
+                self._block = np.empty((min(SEMANTIC_CACHE_BLOCK, self.max_size), query.shape[0]), dtype=np.float32)
+            codes, scale = self._quantize(query)
+            self._codes[self._next] = codes
+            self._scales[self._next] = scale
+            self._responses[self._next] = (response, display_docs)
+            self._tags[self._next] = self._namespace_ids.setdefault(namespace, len(self._namespace_ids))
+            self._expires[self._next] = time.monotonic() + ttl
+            self._next = (self._next + 1) % self.max_size
+            self._size = min(self._size + 1, self.max_size)
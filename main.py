@@ -1,18 +1,22 @@
 import logging
 
 from fastapi import FastAPI
-from nicegui import ui
+from nicegui import app as nicegui_app, ui
 
 from chat.interface.main_tabs import create_main_menu
 from chat.interface.chat_constructor import create_chat_page
+from chat.interface.chat_api import create_chat_api
 from config.settings import (
     AppConfig,
     ClientsConfig,
+    EmbeddingModelsConfig,
     NLPConfig,
     RAGTabConfig,
     CodeAssistantTabConfig,
 )
+from llm.ollama_configs import warmup_models
 from llm.ollama_inference import ask_llm
+from llm.semantic_cache import SemanticLLMCache
 from chat.backend.dialogue import Dialogue
 
 LOG_PATH = "rag_chatbot.log"
@@ -28,6 +32,7 @@ logging.basicConfig(
 app_config = AppConfig()
 clients_config = ClientsConfig()
 nlp_config = NLPConfig()
+embedding_models_config = EmbeddingModelsConfig()
 logger = logging.getLogger(__name__)
 
 dialogue = Dialogue(
@@ -37,6 +42,10 @@ dialogue = Dialogue(
     logger=logger,
 )
 
+nicegui_app.on_startup(dialogue.warmup)
+nicegui_app.on_startup(warmup_models)
+nicegui_app.on_shutdown(dialogue.aclose)
+
 app: FastAPI = FastAPI()
 tabs = [RAGTabConfig(), CodeAssistantTabConfig()]
 
@@ -52,5 +61,20 @@ for tab in tabs:
         logger=logger,
     )
 
+# Served by NiceGUI's own FastAPI app, next to the chat pages
+create_chat_api(
+    tabs=tabs,
+    app=nicegui_app,
+    app_config=app_config,
+    dialogue=dialogue,
+    embedder=embedding_models_config.dense,
+    semantic_cache=SemanticLLMCache(
+        threshold=app_config.semantic_cache_threshold,
+        max_size=app_config.semantic_cache_size,
+    ),
+    ask_llm=ask_llm,
+    logger=logger,
+)
+
 if __name__ in {"__main__", "__mp_main__"}:
-    ui.run(port=app_config.app_port, show=True)
+    ui.run(port=app_config.app_port, show=True, reload=False, loop="uvloop", http="httptools")
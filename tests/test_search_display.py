@@ -0,0 +1,34 @@
+import asyncio
+import logging
+
+from chat.interface.chat_utils import search_display
+from databases.searcher.searcher_client import HybridHit
+
+logger = logging.getLogger(__name__)
+
+
+def make_hit(payload: dict) -> HybridHit:
+    return HybridHit(id="1", score=1.0, source="dense", payload=payload)
+
+
+def test_search_display_with_non_string_file_paths():
+    hits = [
+        make_hit({"document": "first", "file_path": "docs/a.pdf"}),
+        make_hit({"document": "second", "file_path": 42}),
+        make_hit({"document": "third", "file_path": ["docs", "b.pdf"]}),
+        make_hit({"document": "fourth", "file_path": None}),
+    ]
+
+    docs, display_docs = asyncio.run(search_display(hits, logger))
+
+    assert docs == ("first", "second", "third", "fourth")
+    assert display_docs == "Релевантные документы:\n\n" + "\n\n".join(
+        sorted(["docs/a.pdf", "42", "['docs', 'b.pdf']", "—"])
+    )
+
+
+def test_hybrid_hit_defaults_for_missing_payload_fields():
+    hit = make_hit({"document": None})
+
+    assert hit.document == ""
+    assert hit.file_path == "—"